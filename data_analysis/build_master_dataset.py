@@ -13,6 +13,7 @@ actuary analysis, and UI dashboards.
 import os
 import pandas as pd
 from data_ingestion.merge_sb_5500 import merge_sb_5500
+from utils.file_helpers import write_parquet
 
 
 
@@ -110,9 +111,9 @@ def build_master_dataset(yearly_merged_list) -> pd.DataFrame:
 # -------------------------------------------------------------
 
 def save_master_as_parquet(df, filename="master_db_latest.parquet"):
-    """Save master dataset in Parquet format for fast analytics."""
+    """Save master dataset in Parquet format for fast analytics (sorted by retirees, largest first)."""
     output_path = os.path.join("data_output", filename)
-    df.to_parquet(output_path, index=False)
+    write_parquet(df, output_path, sort_by="RETIREE_COUNT", descending=True)
     print(f"\n[✔] Saved Parquet file → {output_path}")
 
 
@@ -10,6 +10,7 @@ Aggregates all DB plans by EIN:
 
 import os
 import pandas as pd
+from utils.file_helpers import write_parquet
 
 
 
@@ -168,7 +169,8 @@ def build_sponsor_rollup(master_df: pd.DataFrame) -> pd.DataFrame:
 
 def save_sponsor_rollup_parquet(df, filename="sponsor_rollup_latest.parquet"):
     output_path = os.path.join("data_output", filename)
-    df.to_parquet(output_path, index=False)
+    # Keyed on EIN; TRACKING_ID (EIN-PLAN_NUMBER) gives the same order when EIN isn't a column
+    write_parquet(df, output_path, sort_by="EIN" if "EIN" in df.columns else "TRACKING_ID")
     print(f"[✔] Saved Sponsor Parquet → {output_path}")
 
 
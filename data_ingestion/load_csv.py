@@ -205,13 +205,13 @@ def load_5500_csv(
 
     for col in int_fields:
         try:
-            df[col] = df[col].str.replace(",", "").astype("Int64")
+            df[col] = df[col].str.replace(",", "", regex=False).astype("Int64")
         except Exception:
             df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
 
     for col in float_fields:
         try:
-            df[col] = df[col].str.replace(",", "").astype(float)
+            df[col] = df[col].str.replace(",", "", regex=False).astype(float)
         except Exception:
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
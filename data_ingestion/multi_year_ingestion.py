@@ -16,7 +16,9 @@ Responsibilities:
 """
 
 import os
+import json
 import pandas as pd
+from utils.file_helpers import write_parquet
 from .load_csv import load_csv
 from .normalize_sb_fields import normalize_sb_fields
 from .normalize_sr_fields import normalize_sr_fields
@@ -37,6 +39,51 @@ SCH_H_PREFIX = "F_SCH_H_"
 
 SB_TERM_PARTCP_CNT = "SB_TERM_PARTCP_CNT"
 
+# Precomputed Dashboard "Top Plans" table (N matches the app's slider maximum)
+TOP_PLANS_N = 50
+TOP_PLAN_COLUMNS = [
+    "EIN", "PLAN_NAME", "ACTIVE_COUNT", "RETIREE_COUNT", "SEPARATED_COUNT",
+    "TOTAL_PARTICIPANTS", "TOTAL_LIABILITY", "LIABILITY_TOTAL",
+]
+
+def write_year_summary(df: pd.DataFrame, year: int) -> str:
+    """
+    Write the Dashboard KPI scalars for a year next to its parquet file,
+    so the Streamlit app can read them instead of rescanning the data.
+    """
+    def col_sum(col):
+        if col not in df.columns:
+            return None
+        return float(pd.to_numeric(df[col], errors="coerce").sum())
+
+    retirees = col_sum("RETIREE_COUNT")
+    participants = col_sum("TOTAL_PARTICIPANTS")
+    summary = {
+        "n_plans": int(len(df)),
+        "n_ein": int(df["EIN"].nunique()),
+        "retirees": int(retirees) if retirees is not None else None,
+        "liability": col_sum("TOTAL_LIABILITY"),
+        "participants": int(participants) if participants is not None else None,
+    }
+    out_path = os.path.join(OUTPUT_DIR, f"db_plans_{year}_summary.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return out_path
+
+def write_top_plans(df: pd.DataFrame, year: int):
+    """
+    Write the year's largest plans by retiree count so the Dashboard
+    can read them directly instead of sorting the full year every rerun.
+    """
+    if "RETIREE_COUNT" not in df.columns:
+        return None
+    cols = [c for c in TOP_PLAN_COLUMNS if c in df.columns]
+    ranked = df[cols].assign(RETIREE_COUNT=pd.to_numeric(df["RETIREE_COUNT"], errors="coerce"))
+    top = ranked.nlargest(TOP_PLANS_N, "RETIREE_COUNT")
+    out_path = os.path.join(OUTPUT_DIR, f"db_plans_{year}_top_retirees.parquet")
+    top.to_parquet(out_path, index=False)
+    return out_path
+
 def process_year(year: int, include_schedule_h: bool = True) -> pd.DataFrame:
     """
     Process a single year: load, normalize, merge, validate, and return merged DataFrame.
@@ -95,11 +142,31 @@ def process_year(year: int, include_schedule_h: bool = True) -> pd.DataFrame:
     if SB_TERM_PARTCP_CNT in merged_sr.columns:
         assert merged_sr[SB_TERM_PARTCP_CNT].notnull().all(), f"Null SB_TERM_PARTCP_CNT in year {year}."
 
+    # Store EIN as a string column, rows sorted by EIN, so parquet row-group min/max stats
+    # let EIN prefix lookups skip row groups (parquet dictionary-encodes it by default)
+    merged_sr["EIN"] = merged_sr["EIN"].astype("string")
+
     # Write annual output
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     out_path = os.path.join(OUTPUT_DIR, f"db_plans_{year}.parquet")
-    merged_sr.to_parquet(out_path, index=False)
+    # Repeated name columns as categoricals: written as parquet DICTIONARY columns, loaded back as categoricals
+    category_cols = {c: "category" for c in ["SPONSOR_DFE_NAME", "PLAN_NAME", "INDUSTRY_SECTOR"] if c in merged_sr.columns}
+    out_df = merged_sr.astype(category_cols)
+    # Lower-cased sponsor + plan name blob, so app text search is one case-sensitive substring scan.
+    # Added to the written copy only: the returned frame (and db_plans_master) stays unchanged
+    name_cols = [c for c in ["SPONSOR_DFE_NAME", "SPONSOR_NAME", "PLAN_NAME"] if c in merged_sr.columns]
+    if name_cols:
+        blob = merged_sr[name_cols[0]].fillna("").astype(str)
+        for c in name_cols[1:]:
+            blob = blob + "\t" + merged_sr[c].fillna("").astype(str)
+        out_df["SEARCH_BLOB"] = blob.str.lower()
+    write_parquet(out_df, out_path, sort_by=["EIN", "PLAN_NUMBER"])
     print(f"[Year {year}] Wrote {out_path} ({len(merged_sr)} rows)")
+    summary_path = write_year_summary(merged_sr, year)
+    print(f"[Year {year}] Wrote {summary_path}")
+    top_path = write_top_plans(merged_sr, year)
+    if top_path:
+        print(f"[Year {year}] Wrote {top_path}")
     return merged_sr
 
 def run_multi_year_pipeline():
@@ -39,7 +39,7 @@ def normalize_sch_h_fields(df: pd.DataFrame) -> pd.DataFrame:
     
     # Identifiers
     out['ACK_ID'] = df['ACK_ID'].astype(str).str.strip() if 'ACK_ID' in df.columns else pd.NA
-    out['EIN'] = df['SCH_H_EIN'].astype(str).str.strip().str.replace(r'\.0$', '', regex=True) if 'SCH_H_EIN' in df.columns else pd.NA
+    out['EIN'] = df['SCH_H_EIN'].astype(str).str.strip().str.removesuffix('.0') if 'SCH_H_EIN' in df.columns else pd.NA
     out['PLAN_NUMBER'] = df['SCH_H_PN'].astype(str).str.strip().str.zfill(3) if 'SCH_H_PN' in df.columns else pd.NA
     
     # Plan Year
@@ -1,40 +1,86 @@
 import pandas as pd
+import json
 import os
-from serpapi import GoogleSearch
-from dotenv import load_dotenv
+import sqlite3
+import time
+from contextlib import closing
+from functools import lru_cache
+
+ROLLUP_PATH = "data_output/sponsor_rollup_latest.parquet"
+SERP_CACHE_PATH = "data_output/serp_cache.db"
+SERP_CACHE_TTL = 60 * 60 * 24  # seconds
+
 
 # ----------------------------------------------------------
-# Load environment variables (SERP_API_KEY)
+# Load environment variables (SERP_API_KEY) on first live lookup
 # ----------------------------------------------------------
-load_dotenv()
+@lru_cache(maxsize=None)
+def _serp_api_key():
+    from dotenv import load_dotenv
 
-SERP_API_KEY = os.getenv("SERP_API_KEY")
-if not SERP_API_KEY:
-    raise ValueError("Missing SERP_API_KEY in your .env file!")
+    load_dotenv()
+    key = os.getenv("SERP_API_KEY")
+    if not key:
+        raise ValueError("Missing SERP_API_KEY in your .env file!")
+    return key
 
-ROLLUP_PATH = "data_output/sponsor_rollup_latest.parquet"
+
+# ----------------------------------------------------------
+# SERP RESULT CACHE (SQLite, persists across runs)
+# ----------------------------------------------------------
+def _open_serp_cache():
+    os.makedirs(os.path.dirname(SERP_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(SERP_CACHE_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS serp(q TEXT PRIMARY KEY, ts INTEGER, payload BLOB)")
+    return conn
+
+
+def _cached_results(conn, query):
+    """Return cached results for query if younger than SERP_CACHE_TTL, else None."""
+    row = conn.execute("SELECT ts, payload FROM serp WHERE q = ?", (query,)).fetchone()
+    if row is None or time.time() - row[0] > SERP_CACHE_TTL:
+        return None
+    return json.loads(row[1])
 
 
 # ----------------------------------------------------------
 # SERP LOOKUP
 # ----------------------------------------------------------
 def serp_lookup(query):
-    """Perform SERP API lookup and return the top 5 organic results."""
+    """Perform SERP API lookup and return the top 5 organic results.
+
+    Results are cached in SQLite for SERP_CACHE_TTL, so repeat queries skip the API call.
+    """
+    # closing() releases the connection; the inner `conn` block commits the transaction
+    with closing(_open_serp_cache()) as conn, conn:
+        cached = _cached_results(conn, query)
+    if cached is not None:
+        return cached
+
+    from serpapi import GoogleSearch
+
     params = {
         "engine": "google",
         "q": query,
-        "api_key": SERP_API_KEY,
+        "api_key": _serp_api_key(),
         "num": 10
     }
 
     try:
         search = GoogleSearch(params)
         results = search.get_dict()
-        return results.get("organic_results", [])[:5]
+        organic = results.get("organic_results", [])[:5]
     except Exception as e:
         print(f"SERP Lookup Error: {e}")
         return []
 
+    with closing(_open_serp_cache()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO serp(q, ts, payload) VALUES (?, ?, ?)",
+            (query, int(time.time()), json.dumps(organic)),
+        )
+    return organic
+
 
 # ----------------------------------------------------------
 # IMPROVED PENSION-ACTUARY QUERY GENERATOR
@@ -1,32 +1,57 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import hashlib
+import hmac
 import os
-import re
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.normalize_firm_names import normalize_firm_name
+from utils.normalize_firm_names import normalize_firm_names_series
 from utils.naics_codes import get_naics_sector, get_naics_description
+from streamlit_app.data import (
+    PROJECT_ROOT,
+    YEARLY_DIR,
+    db_dataset,
+    list_years,
+    load_db_parquet,
+    load_top_plans,
+    load_year_summary,
+    query_db,
+)
 
 # =============================
 # SIMPLE PASSWORD PROTECTION
 # =============================
-PASSWORD = "CVUSTool"  # CHANGE FOR DEPLOYMENT
+def load_password_hash():
+    """Hex SHA-256 of the access password from st.secrets [auth] password_sha256, else CVUS_PASSWORD_SHA256."""
+    try:
+        digest = st.secrets["auth"]["password_sha256"]
+    except (FileNotFoundError, KeyError):
+        digest = os.environ.get("CVUS_PASSWORD_SHA256")
+    return bytes.fromhex(digest.strip()) if digest else None
+
 def password_gate():
+    # Authenticated sessions skip the gate entirely (no widgets built on reruns)
+    if st.session_state.get("authenticated"):
+        return
+    password_hash = load_password_hash()
+    if password_hash is None:
+        st.error("No access password configured: set [auth] password_sha256 in Streamlit secrets or CVUS_PASSWORD_SHA256.")
+        st.stop()
     pw = st.text_input("Enter password:", type="password")
-    if pw == PASSWORD:
+    if pw and hmac.compare_digest(hashlib.sha256(pw.encode()).digest(), password_hash):
         st.session_state["authenticated"] = True
         st.success("Access granted!")
         st.rerun()
     elif pw != "":
         st.error("Incorrect password")
-if "authenticated" not in st.session_state:
-    st.session_state["authenticated"] = False
-if not st.session_state["authenticated"]:
-    password_gate()
     st.stop()
+password_gate()
 
 # =============================
 # SIDEBAR NAVIGATION
@@ -43,22 +68,16 @@ menu = st.sidebar.radio(
 )
 
 if menu == "Logout":
-    st.session_state["authenticated"] = False
+    # Clear only this session's state (auth, widgets, filters) so the next login starts on the Dashboard;
+    # the shared data caches are deliberately left warm for the next session
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
     st.rerun()
 
 # =============================
 # YEAR SELECTION & DATA LOADING
 # =============================
-# Get the directory where this script lives, then go up one level to the project root
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
-YEARLY_DIR = os.path.join(PROJECT_ROOT, "data_output", "yearly")
-year_files = [f for f in os.listdir(YEARLY_DIR) if f.startswith("db_plans_") and f.endswith(".parquet")]
-years_available = sorted([
-    int(m.group(1))
-    for f in year_files
-    if (m := re.match(r"db_plans_(\d{4})\.parquet$", f))
-])
+years_available = list_years()
 if not years_available:
     st.error("No yearly DB plan files found in data_output/yearly.")
     st.stop()
@@ -67,16 +86,34 @@ st.sidebar.markdown("## Data Controls")
 selected_year = st.sidebar.selectbox("Filing Year", years_available, index=years_available.index(def_year))
 st.sidebar.markdown("---")
 
-@st.cache_data
-def load_db_parquet(year):
-    path = os.path.join(YEARLY_DIR, f"db_plans_{year}.parquet")
-    if not os.path.exists(path):
-        st.error(f"Missing required dataset: `{path}`")
-        st.stop()
-    return pd.read_parquet(path)
-
 db = load_db_parquet(selected_year)
 
+# =============================
+# SHARED HELPERS
+# =============================
+def distinct_values(series):
+    """Sorted distinct non-null values; a categorical's categories are read directly instead of scanning rows."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return sorted(series.cat.categories.tolist())
+    return sorted(series.dropna().unique().tolist())
+
+def fmt_money(s, decimals=None):
+    """Format a numeric Series as $B / $M / $K strings (decimals: per-unit default B=2, M/K=0, or one int for all)."""
+    s = pd.to_numeric(pd.Series(s), errors="coerce").astype("float64")
+    a = s.abs()
+    dec = {"B": 2, "M": 0, "K": 0} if decimals is None else dict.fromkeys("BMK", decimals)
+    # Pick the unit from the value as it will be rounded, so 999,600 shows as $1M rather than $1000K
+    is_b = (a / 1e6).round(dec["M"]) >= 1000
+    is_m = ~is_b & ((a / 1e3).round(dec["K"]) >= 1000)
+    is_k = ~is_b & ~is_m & s.notna()
+    out = pd.Series("N/A", index=s.index, dtype=object)
+    for unit, scale, mask in (("B", 1e9, is_b), ("M", 1e6, is_m), ("K", 1e3, is_k)):
+        scaled = (a[mask] / scale).round(dec[unit])
+        # Format each distinct rounded value once (keeps thousands separators), then map the rows
+        out[mask] = scaled.map({x: f"{x:,.{dec[unit]}f}{unit}" for x in scaled.unique()})
+    prefix = np.where(s < 0, "-$", "$")
+    return out.where(s.isna(), prefix + out)
+
 # =============================
 # DASHBOARD PAGE
 # =============================
@@ -86,17 +123,32 @@ if menu == "Dashboard":
 
     # --- KPIs ---
     kpi_cols = st.columns(4)
-    total_plans = len(db)
-    retiree_col = "RETIREE_COUNT" if "RETIREE_COUNT" in db.columns else None
-    total_retirees = int(db[retiree_col].sum()) if retiree_col else "N/A"
-    liability_col = "LIABILITY_TOTAL" if "LIABILITY_TOTAL" in db.columns else None
-    total_liability = float(db[liability_col].sum()) if liability_col else "N/A"
-    participant_col = "TOTAL_PARTICIPANTS" if "TOTAL_PARTICIPANTS" in db.columns else None
-    total_participants = int(db[participant_col].sum()) if participant_col else "N/A"
+    summary_path = os.path.join(YEARLY_DIR, f"db_plans_{selected_year}_summary.json")
+    summary = load_year_summary(summary_path, os.path.getmtime(summary_path)) if os.path.exists(summary_path) else None
+    if summary is None:
+        # No pipeline sidecar: one reduction over all KPI columns instead of a scan per metric
+        retiree_col = "RETIREE_COUNT" if "RETIREE_COUNT" in db.columns else None
+        liability_col = next((c for c in ["TOTAL_LIABILITY", "LIABILITY_TOTAL"] if c in db.columns), None)
+        participant_col = "TOTAL_PARTICIPANTS" if "TOTAL_PARTICIPANTS" in db.columns else None
+        kpi_sums = db[[c for c in (retiree_col, liability_col, participant_col) if c]].sum()
+        summary = {
+            "n_plans": len(db),
+            "n_ein": int(db["EIN"].nunique()) if "EIN" in db.columns else None,
+            "retirees": int(kpi_sums[retiree_col]) if retiree_col else None,
+            "liability": float(kpi_sums[liability_col]) if liability_col else None,
+            "participants": int(kpi_sums[participant_col]) if participant_col else None,
+        }
+    total_plans = summary["n_plans"]
+    total_retirees = summary["retirees"] if summary["retirees"] is not None else "N/A"
+    total_liability = summary["liability"] if summary["liability"] is not None else "N/A"
+    total_participants = summary["participants"] if summary["participants"] is not None else "N/A"
     kpi_cols[0].metric("Total Plans", total_plans)
     kpi_cols[1].metric("Total Retirees", total_retirees)
     kpi_cols[2].metric("Total Liability", f"{total_liability:,.0f}" if total_liability != "N/A" else "N/A")
     kpi_cols[3].metric("Total Participants", total_participants)
+    # Exact distinct-EIN count is persisted by the pipeline; only the no-sidecar fallback hashes the column
+    if summary.get("n_ein") is not None:
+        st.caption(f"{summary['n_ein']:,} distinct plan sponsors (EIN)")
 
     st.markdown("---")
     # Modified: Removed 'Plan Size Distribution' and 'Participant Mix' tabs, added 'Location' tab
@@ -112,8 +164,14 @@ if menu == "Dashboard":
         active_col = "ACTIVE_COUNT" if "ACTIVE_COUNT" in db.columns else None
         total_col = "TOTAL_PARTICIPANTS" if "TOTAL_PARTICIPANTS" in db.columns else None
         if retiree_col:
-            cols = [c for c in ["EIN", "PLAN_NAME", active_col, retiree_col, separated_col, total_col, "LIABILITY_TOTAL"] if c and c in db.columns]
-            top_plans = db.sort_values(retiree_col, ascending=False).head(top_n)
+            liability_col = next((c for c in ["TOTAL_LIABILITY", "LIABILITY_TOTAL"] if c in db.columns), None)
+            cols = [c for c in ["EIN", "PLAN_NAME", active_col, retiree_col, separated_col, total_col, liability_col] if c and c in db.columns]
+            top_path = os.path.join(YEARLY_DIR, f"db_plans_{selected_year}_top_retirees.parquet")
+            if os.path.exists(top_path):
+                top_plans = load_top_plans(top_path, os.path.getmtime(top_path)).head(top_n)
+                cols = [c for c in cols if c in top_plans.columns]
+            else:
+                top_plans = db.nlargest(top_n, retiree_col)
             st.dataframe(top_plans[cols], use_container_width=True)
             st.download_button("Download Table", top_plans[cols].to_csv(index=False), file_name="top_plans.csv")
         else:
@@ -218,12 +276,13 @@ elif menu == "Substitute Mortality":
     mortality_col = next((c for c in ["MORTALITY_CODE", "SB_MORTALITY_TBL_CD"] if c in db.columns), None)
     
     if mortality_col and mortality_col in db.columns:
-        # Clean up mortality codes
-        db_mort = db.copy()
-        db_mort[mortality_col] = pd.to_numeric(db_mort[mortality_col], errors='coerce')
+        # Clean up mortality codes (coerce the one column, copy only the valid rows)
+        mort_codes = pd.to_numeric(db[mortality_col], errors='coerce')
         
         # Filter to valid codes (1, 2, 3)
-        db_mort_valid = db_mort[db_mort[mortality_col].isin([1, 2, 3])].copy()
+        valid_mask = mort_codes.isin([1, 2, 3])
+        db_mort_valid = db[valid_mask].copy()
+        db_mort_valid[mortality_col] = mort_codes[valid_mask]
         
         # Define labels for the codes
         code_labels = {
@@ -526,14 +585,23 @@ elif menu == "Industry Explorer":
     
     # Add industry classification to data
     if "BUSINESS_CODE" in db.columns:
-        db_ind = db.copy()
-        db_ind["INDUSTRY_SECTOR"] = db_ind["BUSINESS_CODE"].astype(str).apply(get_naics_sector)
-        db_ind["INDUSTRY_NAME"] = db_ind["BUSINESS_CODE"].astype(str).apply(get_naics_description)
-        db_ind["MORTALITY_CODE"] = pd.to_numeric(db_ind.get("MORTALITY_CODE", pd.Series()), errors='coerce')
+        # Derived columns as standalone Series, joined onto only the columns this page reads
+        # (no full copy of the shared yearly frame)
+        business_codes = db["BUSINESS_CODE"].astype(str)
+        mortality_code = pd.to_numeric(db.get("MORTALITY_CODE", pd.Series(index=db.index, dtype="float64")), errors='coerce')
         
         # Mortality code labels
         mortality_labels = {1: "Prescribed Combined", 2: "Prescribed Separate", 3: "Substitute"}
-        db_ind["MORTALITY_TYPE"] = db_ind["MORTALITY_CODE"].map(mortality_labels).fillna("Unknown")
+        ind_cols = [c for c in [
+            "EIN", "SPONSOR_DFE_NAME", "PLAN_NAME", "ACTUARY_FIRM_NAME", "SB_ACTUARY_FIRM_NAME",
+            "ACTIVE_COUNT", "RETIREE_COUNT", "TOTAL_PARTICIPANTS", "TOTAL_LIABILITY", "LIABILITY_TOTAL",
+        ] if c in db.columns]
+        db_ind = db[ind_cols].assign(
+            INDUSTRY_SECTOR=business_codes.apply(get_naics_sector),
+            INDUSTRY_NAME=business_codes.apply(get_naics_description),
+            MORTALITY_CODE=mortality_code,
+            MORTALITY_TYPE=mortality_code.map(mortality_labels).fillna("Unknown"),
+        )
         
         # --- Filters in sidebar ---
         st.sidebar.markdown("## Industry Filters")
@@ -556,8 +624,8 @@ elif menu == "Industry Explorer":
             help="Filter by mortality table usage"
         )
         
-        # Apply filters
-        filtered = db_ind.copy()
+        # Apply filters (boolean indexing yields new frames; no copy needed when unfiltered)
+        filtered = db_ind
         
         if selected_sectors:
             filtered = filtered[filtered["INDUSTRY_SECTOR"].isin(selected_sectors)]
@@ -686,7 +754,7 @@ elif menu == "Industry Explorer":
             
             if actuary_col:
                 # Normalize firm names
-                filtered["NORMALIZED_FIRM"] = filtered[actuary_col].apply(normalize_firm_name)
+                normalized_firm = normalize_firm_names_series(filtered[actuary_col]).rename("NORMALIZED_FIRM")
                 
                 agg_dict = {"EIN": "count"}
                 if retiree_col:
@@ -694,7 +762,7 @@ elif menu == "Industry Explorer":
                 if liability_col:
                     agg_dict[liability_col] = "sum"
                 
-                firm_summary = filtered.groupby("NORMALIZED_FIRM").agg(agg_dict).reset_index()
+                firm_summary = filtered.groupby(normalized_firm).agg(agg_dict).reset_index()
                 firm_summary = firm_summary.rename(columns={
                     "NORMALIZED_FIRM": "Actuarial Firm",
                     "EIN": "# Plans",
@@ -806,7 +874,7 @@ elif menu == "PRT Analysis":
                 )
                 summary_df = pd.DataFrame({
                     'Plan Count': asset_dist,
-                    'Total Assets': asset_by_cat.apply(lambda x: f"${x/1e9:,.2f}B")
+                    'Total Assets': fmt_money(asset_by_cat)
                 })
                 st.dataframe(summary_df)
     
@@ -848,8 +916,8 @@ elif menu == "PRT Analysis":
             
             # Format currency columns
             format_df = prt_display.copy()
-            format_df[prt_col] = format_df[prt_col].apply(lambda x: f"${x/1e6:,.1f}M" if pd.notna(x) else "N/A")
-            format_df[assets_col] = format_df[assets_col].apply(lambda x: f"${x/1e6:,.1f}M" if pd.notna(x) else "N/A")
+            format_df[prt_col] = fmt_money(format_df[prt_col], decimals=1)
+            format_df[assets_col] = fmt_money(format_df[assets_col], decimals=1)
             
             st.dataframe(format_df.head(100), use_container_width=True)
             
@@ -865,12 +933,11 @@ elif menu == "PRT Analysis":
         st.subheader("PRT Activity by Industry")
         
         if 'BUSINESS_CODE' in db.columns:
-            # Add industry sector
-            db_industry = db.copy()
-            db_industry['INDUSTRY_SECTOR'] = db_industry['BUSINESS_CODE'].apply(get_naics_sector)
+            # Industry sector as a groupby key (no copy of the yearly frame)
+            industry_sector = db['BUSINESS_CODE'].apply(get_naics_sector).rename('INDUSTRY_SECTOR')
             
             # Aggregate by industry
-            industry_prt = db_industry.groupby('INDUSTRY_SECTOR').agg({
+            industry_prt = db.groupby(industry_sector).agg({
                 prt_col: ['sum', lambda x: (x.fillna(0) > 0).sum()],
                 assets_col: 'sum',
                 'EIN': 'count'
@@ -882,8 +949,8 @@ elif menu == "PRT Analysis":
             
             # Display with formatting
             display_ind = industry_prt.copy()
-            display_ind['Total PRT ($)'] = display_ind['Total PRT ($)'].apply(lambda x: f"${x/1e9:,.2f}B")
-            display_ind['Total Assets ($)'] = display_ind['Total Assets ($)'].apply(lambda x: f"${x/1e9:,.2f}B")
+            display_ind['Total PRT ($)'] = fmt_money(display_ind['Total PRT ($)'])
+            display_ind['Total Assets ($)'] = fmt_money(display_ind['Total Assets ($)'])
             
             st.dataframe(display_ind, use_container_width=True)
             
@@ -926,7 +993,7 @@ elif menu == "PRT Analysis":
             with col3:
                 industry_filter = st.selectbox(
                     "Industry Sector",
-                    ["All Industries"] + sorted(db['INDUSTRY_SECTOR'].dropna().unique().tolist()) if 'INDUSTRY_SECTOR' in db.columns else ["All Industries"]
+                    ["All Industries"] + distinct_values(db['INDUSTRY_SECTOR']) if 'INDUSTRY_SECTOR' in db.columns else ["All Industries"]
                 )
             
             # Apply filters
@@ -957,7 +1024,7 @@ elif menu == "PRT Analysis":
             available_cols = [c for c in display_cols if c in candidates.columns]
             
             cand_display = candidates[available_cols].copy()
-            cand_display[assets_col] = cand_display[assets_col].apply(lambda x: f"${x/1e6:,.1f}M" if pd.notna(x) else "N/A")
+            cand_display[assets_col] = fmt_money(cand_display[assets_col], decimals=1)
             
             st.dataframe(cand_display.head(100), use_container_width=True)
             
@@ -1040,7 +1107,7 @@ elif menu == "PRT Analysis":
             with col1:
                 # Format for display
                 alloc_display = alloc_df.copy()
-                alloc_display['Total ($)'] = alloc_display['Total ($)'].apply(lambda x: f"${x/1e9:,.1f}B")
+                alloc_display['Total ($)'] = fmt_money(alloc_display['Total ($)'], decimals=1)
                 alloc_display['% of Total'] = alloc_display['% of Total'].apply(lambda x: f"{x:.1f}%")
                 st.dataframe(alloc_display)
             
@@ -1064,7 +1131,7 @@ elif menu == "PRT Analysis":
         
         if income_data:
             income_df = pd.DataFrame.from_dict(income_data, orient='index', columns=['Total ($)'])
-            income_df['Total ($)'] = income_df['Total ($)'].apply(lambda x: f"${x/1e9:,.1f}B")
+            income_df['Total ($)'] = fmt_money(income_df['Total ($)'], decimals=1)
             st.dataframe(income_df)
 
 # =============================
@@ -1115,6 +1182,13 @@ elif menu == "PRT History":
         except Exception:
             return str(years)
     
+    def categorical_contains(series, pattern, ignore_case=False):
+        """Literal substring match for a categorical Series, testing each category once in Arrow."""
+        categories = pa.array(series.cat.categories.astype(str), type=pa.string())
+        hits = pc.match_substring(categories, pattern, ignore_case=ignore_case).to_numpy(zero_copy_only=False)
+        # Code -1 (missing) indexes the trailing False
+        return pd.Series(np.append(hits.astype(bool), False)[series.cat.codes.to_numpy()], index=series.index)
+    
     # Load multi-year history if available
     prt_history_path = os.path.join(PROJECT_ROOT, "data_output", "prt_multi_year_history.parquet")
     
@@ -1131,10 +1205,54 @@ elif menu == "PRT History":
         st.stop()
     
     @st.cache_data
-    def load_prt_history():
-        return pd.read_parquet(prt_history_path)
+    def load_prt_history(path, mtime):
+        """Multi-year PRT history; mtime keys the cache so pipeline rewrites refresh it."""
+        df = pd.read_parquet(path)
+        df['NUM_TRANSACTIONS'] = df['NUM_TRANSACTIONS'].astype('int16')
+        # Repeated string keys -> categoricals so groupby/filter work on integer codes
+        for c in ('SPONSOR_NAME', 'EIN', 'PLAN_NAME', 'INDUSTRY_SECTOR'):
+            if c in df.columns:
+                df[c] = df[c].astype('category')
+        return df
+    
+    prt_mtime = os.path.getmtime(prt_history_path)
+    prt_hist = load_prt_history(prt_history_path, prt_mtime)
     
-    prt_hist = load_prt_history()
+    # The derived views below take the frame as an underscore arg (not hashed: its list cells are
+    # unhashable and pickling it per rerun costs more than the work) and are keyed on the file mtime
+    
+    @st.cache_data
+    def compute_yearly_trends(_df, mtime):
+        """Aggregate the per-plan YEARS / PRT_BY_YEAR lists into yearly totals."""
+        long = _df[['YEARS', 'PRT_BY_YEAR']].explode(['YEARS', 'PRT_BY_YEAR']).dropna()
+        long['YEARS'] = long['YEARS'].astype(int)
+        long['PRT_BY_YEAR'] = pd.to_numeric(long['PRT_BY_YEAR'], errors='coerce')
+        yearly_agg = long.groupby('YEARS')['PRT_BY_YEAR'].agg(['sum', 'count']).reset_index()
+        yearly_agg.columns = ['Year', 'Total PRT', 'Transaction Count']
+        return yearly_agg.sort_values('Year')
+    
+    @st.cache_data
+    def compute_sponsor_years(_df, mtime):
+        """Map each sponsor to its sorted unique PRT years with one sort + linear de-dup sweep."""
+        long = _df[['SPONSOR_NAME', 'YEARS']].explode('YEARS').dropna()
+        if len(long) == 0:
+            return {}
+        codes, uniques = pd.factorize(long['SPONSOR_NAME'])
+        years = long['YEARS'].to_numpy(dtype='int64')
+        order = np.lexsort((years, codes))
+        codes, years = codes[order], years[order]
+        # Keep each (sponsor, year) pair only where it differs from the previous one
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (years[1:] != years[:-1])
+        codes, years = codes[keep], years[keep]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        names = np.asarray(uniques)[codes[starts]]
+        return {name: group.tolist() for name, group in zip(names, np.split(years, starts[1:]))}
+    
+    @st.cache_data
+    def compute_sponsor_plan_index(_df, mtime):
+        """Map each sponsor to the row positions of its plans, so drill-downs are a lookup instead of a scan."""
+        return _df.groupby('SPONSOR_NAME', observed=True).indices
     
     # Tabs for different views
     hist_tab1, hist_tab2, hist_tab3, hist_tab4, hist_tab5 = st.tabs([
@@ -1180,7 +1298,7 @@ elif menu == "PRT History":
         top20 = prt_hist.head(20).copy()
         top20['YEARS_STR'] = top20['YEARS'].apply(format_years)
         top20['PRT_BY_YEAR_FMT'] = top20['PRT_BY_YEAR'].apply(format_prt_amounts)
-        top20['TOTAL_PRT_FMT'] = top20['TOTAL_PRT'].apply(lambda x: f"${x/1e6:,.0f}M" if x >= 1e6 else f"${x/1e3:,.0f}K")
+        top20['TOTAL_PRT_FMT'] = fmt_money(top20['TOTAL_PRT'])
         
         display_cols = ['SPONSOR_NAME', 'YEARS_STR', 'PRT_BY_YEAR_FMT', 'TOTAL_PRT_FMT']
         if 'INDUSTRY_SECTOR' in top20.columns:
@@ -1203,16 +1321,18 @@ elif menu == "PRT History":
         st.caption("Aggregated view of PRT activity across all plans for each sponsor")
         
         # Aggregate by sponsor name (normalize to handle slight variations)
-        sponsor_agg = prt_hist.groupby('SPONSOR_NAME').agg({
+        sponsor_agg = prt_hist.groupby('SPONSOR_NAME', observed=True).agg({
             'TOTAL_PRT': 'sum',
             'TRACKING_ID': 'count',  # Number of plans
             'NUM_TRANSACTIONS': 'sum',  # Total transactions across all plans
-            'YEARS': lambda x: sorted(set(y for years in x for y in (years.tolist() if hasattr(years, 'tolist') else years))),
             'EIN': 'first',
         }).reset_index()
         
-        sponsor_agg.columns = ['SPONSOR_NAME', 'TOTAL_PRT', 'NUM_PLANS', 'TOTAL_TRANSACTIONS', 'YEARS_ACTIVE', 'EIN']
+        sponsor_agg.columns = ['SPONSOR_NAME', 'TOTAL_PRT', 'NUM_PLANS', 'TOTAL_TRANSACTIONS', 'EIN']
+        sponsor_years = compute_sponsor_years(prt_hist, prt_mtime)
+        sponsor_agg.insert(4, 'YEARS_ACTIVE', [sponsor_years.get(name, []) for name in sponsor_agg['SPONSOR_NAME']])
         sponsor_agg = sponsor_agg.sort_values('TOTAL_PRT', ascending=False)
+        sponsor_agg.attrs['sorted_by'] = 'TOTAL_PRT'
         
         # Key metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -1244,19 +1364,16 @@ elif menu == "PRT History":
         
         # Apply sorting
         sort_col = {'Total PRT': 'TOTAL_PRT', 'Number of Plans': 'NUM_PLANS', 'Number of Transactions': 'TOTAL_TRANSACTIONS'}[sort_by]
-        filtered_sponsors = filtered_sponsors.sort_values(sort_col, ascending=False)
+        if sort_col != sponsor_agg.attrs.get('sorted_by'):
+            filtered_sponsors = filtered_sponsors.sort_values(sort_col, ascending=False)
         
         st.write(f"**{len(filtered_sponsors):,} sponsors** matching criteria")
         
         # Prepare display
         display_sponsors = filtered_sponsors.copy()
         display_sponsors['YEARS_STR'] = display_sponsors['YEARS_ACTIVE'].apply(format_years)
-        display_sponsors['TOTAL_PRT_FMT'] = display_sponsors['TOTAL_PRT'].apply(
-            lambda x: f"${x/1e9:.2f}B" if x >= 1e9 else f"${x/1e6:,.0f}M"
-        )
-        display_sponsors['AVG_PRT_PER_PLAN'] = (display_sponsors['TOTAL_PRT'] / display_sponsors['NUM_PLANS']).apply(
-            lambda x: f"${x/1e6:,.0f}M"
-        )
+        display_sponsors['TOTAL_PRT_FMT'] = fmt_money(display_sponsors['TOTAL_PRT'])
+        display_sponsors['AVG_PRT_PER_PLAN'] = fmt_money(display_sponsors['TOTAL_PRT'] / display_sponsors['NUM_PLANS'])
         
         display_cols = ['SPONSOR_NAME', 'NUM_PLANS', 'TOTAL_TRANSACTIONS', 'YEARS_STR', 'TOTAL_PRT_FMT', 'AVG_PRT_PER_PLAN']
         
@@ -1288,7 +1405,7 @@ elif menu == "PRT History":
             selected_sponsor = st.selectbox("Select a sponsor to view their plans", sponsor_list, key="sponsor_drilldown")
             
             if selected_sponsor:
-                sponsor_plans = prt_hist[prt_hist['SPONSOR_NAME'] == selected_sponsor].copy()
+                sponsor_plans = prt_hist.iloc[compute_sponsor_plan_index(prt_hist, prt_mtime).get(selected_sponsor, [])]
                 
                 st.write(f"**{len(sponsor_plans)} plan(s)** for {selected_sponsor}")
                 
@@ -1328,7 +1445,7 @@ elif menu == "PRT History":
         # Prepare display with proper formatting
         repeat_df['YEARS_STR'] = repeat_df['YEARS'].apply(format_years)
         repeat_df['AMOUNTS_STR'] = repeat_df['PRT_BY_YEAR'].apply(format_prt_amounts)
-        repeat_df['TOTAL_PRT_FMT'] = repeat_df['TOTAL_PRT'].apply(lambda x: f"${x/1e6:,.0f}M" if x >= 1e6 else f"${x/1e3:,.0f}K")
+        repeat_df['TOTAL_PRT_FMT'] = fmt_money(repeat_df['TOTAL_PRT'])
         
         display_cols = ['SPONSOR_NAME', 'YEARS_STR', 'AMOUNTS_STR', 'TOTAL_PRT_FMT', 'EIN']
         repeat_display = repeat_df[display_cols].rename(columns={
@@ -1352,21 +1469,10 @@ elif menu == "PRT History":
     with hist_tab4:
         st.subheader("PRT Trends Over Time")
         
-        # Calculate yearly totals from the transaction lists
-        yearly_data = []
-        for _, row in prt_hist.iterrows():
-            if isinstance(row['YEARS'], list) and isinstance(row['PRT_BY_YEAR'], list):
-                for year, amount in zip(row['YEARS'], row['PRT_BY_YEAR']):
-                    yearly_data.append({'Year': year, 'PRT_Amount': amount})
-        
-        if yearly_data:
-            yearly_df = pd.DataFrame(yearly_data)
-            yearly_agg = yearly_df.groupby('Year').agg({
-                'PRT_Amount': ['sum', 'count']
-            }).reset_index()
-            yearly_agg.columns = ['Year', 'Total PRT', 'Transaction Count']
-            yearly_agg = yearly_agg.sort_values('Year')
-            
+        # Calculate yearly totals from the transaction lists (cached across reruns)
+        yearly_agg = compute_yearly_trends(prt_hist, prt_mtime)
+        
+        if len(yearly_agg) > 0:
             # Display metrics
             col1, col2 = st.columns(2)
             
@@ -1382,8 +1488,8 @@ elif menu == "PRT History":
             # Summary table
             st.write("### Yearly Summary")
             yearly_display = yearly_agg.copy()
-            yearly_display['Total PRT'] = yearly_display['Total PRT'].apply(lambda x: f"${x/1e9:,.2f}B")
-            yearly_display['Avg Transaction'] = (yearly_agg['Total PRT'] / yearly_agg['Transaction Count']).apply(lambda x: f"${x/1e6:,.1f}M")
+            yearly_display['Total PRT'] = fmt_money(yearly_display['Total PRT'])
+            yearly_display['Avg Transaction'] = fmt_money(yearly_agg['Total PRT'] / yearly_agg['Transaction Count'], decimals=1)
             st.dataframe(yearly_display, use_container_width=True)
     
     # === TAB 5: SEARCH ===
@@ -1394,7 +1500,7 @@ elif menu == "PRT History":
         search_term = st.text_input("Search by sponsor name", placeholder="e.g., IBM, AT&T, Lockheed")
         
         if search_term:
-            search_results = prt_hist[prt_hist['SPONSOR_NAME'].str.contains(search_term, case=False, na=False)].copy()
+            search_results = prt_hist[categorical_contains(prt_hist['SPONSOR_NAME'], search_term, ignore_case=True)].copy()
             
             if len(search_results) == 0:
                 st.info(f"No plans found matching '{search_term}'")
@@ -1404,7 +1510,7 @@ elif menu == "PRT History":
                 # Prepare display with proper formatting
                 search_results['YEARS_STR'] = search_results['YEARS'].apply(format_years)
                 search_results['AMOUNTS_STR'] = search_results['PRT_BY_YEAR'].apply(format_prt_amounts)
-                search_results['TOTAL_PRT_FMT'] = search_results['TOTAL_PRT'].apply(lambda x: f"${x/1e6:,.0f}M" if x >= 1e6 else f"${x/1e3:,.0f}K")
+                search_results['TOTAL_PRT_FMT'] = fmt_money(search_results['TOTAL_PRT'])
                 
                 display_cols = ['SPONSOR_NAME', 'PLAN_NAME', 'EIN', 'YEARS_STR', 'AMOUNTS_STR', 'TOTAL_PRT_FMT']
                 available_cols = [c for c in display_cols if c in search_results.columns]
@@ -1423,7 +1529,7 @@ elif menu == "PRT History":
         
         if ein_search:
             ein_clean = ein_search.replace('-', '').strip()
-            ein_results = prt_hist[prt_hist['EIN'].astype(str).str.contains(ein_clean, na=False)].copy()
+            ein_results = prt_hist[categorical_contains(prt_hist['EIN'], ein_clean)].copy()
             
             if len(ein_results) == 0:
                 st.info(f"No plans found for EIN '{ein_search}'")
@@ -1457,16 +1563,20 @@ elif menu == "Actuarial Firms":
     actuary_state_col = next((c for c in ["ACTUARY_STATE", "SB_ACTUARY_US_STATE"] if c in db.columns), None)
     
     if actuary_firm_col and actuary_firm_col in db.columns:
-        # Clean up firm names for filtering
-        db_firms = db.copy()
-        db_firms[actuary_firm_col] = db_firms[actuary_firm_col].fillna("").astype(str).str.strip()
+        # Clean up firm names for filtering (only materialize the columns this page uses)
+        firm_page_cols = [actuary_firm_col, "EIN", "PLAN_NAME", "SPONSOR_DFE_NAME", "SPONSOR_NAME",
+                          actuary_name_col, actuary_city_col, actuary_state_col,
+                          "ACTIVE_COUNT", "RETIREE_COUNT", "SEPARATED_COUNT", "TOTAL_PARTICIPANTS", "TOTAL_LIABILITY"]
+        firm_page_cols = list(dict.fromkeys(c for c in firm_page_cols if c and c in db.columns))
+        db_firms = db[firm_page_cols].dropna(subset=[actuary_firm_col])
+        db_firms[actuary_firm_col] = db_firms[actuary_firm_col].astype(str).str.strip()
         db_firms = db_firms[db_firms[actuary_firm_col] != ""]
         
         # Store original firm names for reference
         db_firms["ORIGINAL_FIRM_NAME"] = db_firms[actuary_firm_col]
         
         # Apply firm name normalization to consolidate variations
-        db_firms["NORMALIZED_FIRM"] = db_firms[actuary_firm_col].apply(normalize_firm_name)
+        db_firms["NORMALIZED_FIRM"] = normalize_firm_names_series(db_firms[actuary_firm_col])
         
         # Toggle for normalized vs raw view
         use_normalized = st.sidebar.checkbox("Consolidate firm name variations", value=True, 
@@ -1500,7 +1610,8 @@ elif menu == "Actuarial Firms":
             
             # Filter firms based on search
             if firm_search:
-                filtered_firms = [f for f in all_firms if firm_search.lower() in f.lower()]
+                firm_array = pa.array(all_firms, type=pa.string())
+                filtered_firms = firm_array.filter(pc.match_substring(firm_array, firm_search, ignore_case=True)).to_pylist()
             else:
                 filtered_firms = all_firms
             
@@ -1628,22 +1739,22 @@ elif menu == "Data Explorer":
     st.title("Data Explorer")
     st.caption(f"Explore and filter DB plan data for {selected_year}.")
     st.markdown("---")
-    # Filter widgets
-    col1, col2 = st.columns(2)
-    with col1:
-        ein_filter = st.text_input("Filter by EIN (partial or full)")
-    with col2:
-        sponsor_col = next((c for c in ["SPONSOR_DFE_NAME", "SPONSOR_NAME"] if c in db.columns), None)
-        sponsor_filter = st.text_input("Filter by Plan Sponsor Name (partial)")
-    filtered = db.copy()
-    if ein_filter:
-        filtered = filtered[filtered["EIN"].astype(str).str.contains(ein_filter, case=False, na=False)]
-    if sponsor_filter and sponsor_col:
-        filtered = filtered[filtered[sponsor_col].astype(str).str.contains(sponsor_filter, case=False, na=False)]
-    st.write(f"Showing {len(filtered)} plans.")
-    # Determine sponsor and plan name columns
-    sponsor_col = next((c for c in ["SPONSOR_DFE_NAME", "SPONSOR_NAME"] if c in filtered.columns), None)
-    plan_name_col = next((c for c in ["PLAN_NAME"] if c in filtered.columns), None)
+    sponsor_col = next((c for c in ["SPONSOR_DFE_NAME", "SPONSOR_NAME"] if c in db.columns), None)
+    # Filter widgets live in a form so typing doesn't rerun the app; filters apply on Search.
+    # The last submitted filters are kept in session state so they survive page switches.
+    last_ein, last_sponsor = st.session_state.get("explorer_filters", ("", ""))
+    with st.form("explorer_filters_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            ein_filter = st.text_input("Filter by EIN (leading digits or full)", value=last_ein)
+        with col2:
+            sponsor_filter = st.text_input("Filter by Plan Sponsor or Plan Name (partial)", value=last_sponsor)
+        if st.form_submit_button("Search"):
+            st.session_state["explorer_filters"] = (ein_filter, sponsor_filter)
+    ein_filter, sponsor_filter = st.session_state.get("explorer_filters", ("", ""))
+    ein_prefix = ein_filter.replace("-", "").strip()
+    # Determine plan name column
+    plan_name_col = next((c for c in ["PLAN_NAME"] if c in db.columns), None)
     # Build display columns: always show sponsor and plan name if available
     display_cols = []
     if sponsor_col:
@@ -1651,8 +1762,19 @@ elif menu == "Data Explorer":
     if plan_name_col:
         display_cols.append(plan_name_col)
     # Add the rest of the columns (avoid duplicates)
-    display_cols += [col for col in filtered.columns if col not in display_cols]
-    st.dataframe(filtered[display_cols], use_container_width=True)
+    display_cols += [col for col in db.columns if col not in display_cols]
+    if ein_prefix or sponsor_filter:
+        # Non-matching rows are dropped inside the parquet scan
+        filtered = query_db(selected_year, tuple(display_cols), ein_prefix, sponsor_filter, sponsor_col)
+    else:
+        filtered = db[display_cols]
+    # Only send one page of rows to the browser; the download below still has every match
+    page_size = 500
+    n_pages = max(1, -(-len(filtered) // page_size))
+    page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+    page_df = filtered.iloc[(page - 1) * page_size:page * page_size]
+    st.write(f"Showing {len(page_df):,} of {len(filtered):,} plans (page {page} of {n_pages}).")
+    st.dataframe(page_df, use_container_width=True)
     st.download_button("Download Filtered Data", filtered[display_cols].to_csv(index=False), file_name="filtered_plans.csv")
 
 # =============================
@@ -0,0 +1,95 @@
+"""
+data.py
+-------
+Data access for the Streamlit app: path constants and the cached yearly
+loaders shared by every page. Kept out of app.py so the page script only
+holds layout and page logic.
+"""
+
+import json
+import os
+import re
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import streamlit as st
+
+# Directory of the app scripts, then one level up to the project root
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+YEARLY_DIR = os.path.join(PROJECT_ROOT, "data_output", "yearly")
+
+def list_years():
+    """Filing years with a db_plans_<year>.parquet in YEARLY_DIR, ascending."""
+    year_files = [f for f in os.listdir(YEARLY_DIR) if f.startswith("db_plans_") and f.endswith(".parquet")]
+    return sorted([
+        int(m.group(1))
+        for f in year_files
+        if (m := re.match(r"db_plans_(\d{4})\.parquet$", f))
+    ])
+
+@st.cache_resource
+def db_dataset(year):
+    """Shared pyarrow Dataset handle for a year (parquet footer/metadata parsed once)."""
+    path = os.path.join(YEARLY_DIR, f"db_plans_{year}.parquet")
+    if not os.path.exists(path):
+        st.error(f"Missing required dataset: `{path}`")
+        st.stop()
+    return ds.dataset(path, format="parquet")
+
+def _to_frame(tbl):
+    """Arrow table -> pandas with the app's dtypes (shared by every yearly loader)."""
+    # Keep strings Arrow-backed (no per-value Python objects) and release Arrow buffers as columns convert
+    string_types = {pa.string(): pd.StringDtype("pyarrow"), pa.large_string(): pd.StringDtype("pyarrow")}
+    df = tbl.to_pandas(types_mapper=string_types.get, split_blocks=True, self_destruct=True)
+    # Downcast participant counts once so every groupby/sum scans half the bytes
+    # (money columns stay float64: float32 cannot hold dollar amounts exactly)
+    for c in ["ACTIVE_COUNT", "RETIREE_COUNT", "SEPARATED_COUNT", "TOTAL_PARTICIPANTS"]:
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype("Int32")
+    return df
+
+@st.cache_data
+def query_db(year, columns, ein_prefix="", sponsor_filter="", sponsor_col=None):
+    """Materialize a projected slice matching the Data Explorer filters (filter pushed into the scan).
+
+    Cached on the plain filter inputs; the Arrow expression is rebuilt here on a miss.
+    """
+    dataset = db_dataset(year)
+    filter_expr = None
+    if ein_prefix:
+        # Prefix match, also expressed as a range so EIN-sorted row groups are pruned from their stats
+        ein_field = pc.field("EIN")
+        ein_upper = ein_prefix[:-1] + chr(ord(ein_prefix[-1]) + 1)
+        filter_expr = pc.starts_with(ein_field, ein_prefix) & (ein_field >= ein_prefix) & (ein_field < ein_upper)
+    sponsor_expr = None
+    if sponsor_filter and "SEARCH_BLOB" in dataset.schema.names:
+        # Pre-lowered name column: lower the query once, then a plain case-sensitive match
+        sponsor_expr = pc.match_substring(pc.field("SEARCH_BLOB"), sponsor_filter.lower())
+    elif sponsor_filter and sponsor_col:
+        sponsor_expr = pc.match_substring(pc.field(sponsor_col).cast(pa.string()), sponsor_filter, ignore_case=True)
+    if sponsor_expr is not None:
+        filter_expr = sponsor_expr if filter_expr is None else filter_expr & sponsor_expr
+    return _to_frame(dataset.to_table(columns=list(columns), filter=filter_expr))
+
+# cache_resource: one shared, read-only frame per year for all sessions (pages copy before mutating)
+@st.cache_resource
+def load_db_parquet(year):
+    dataset = db_dataset(year)
+    # SEARCH_BLOB is only used for scan-time filtering; keep it out of the in-memory frame
+    columns = [c for c in dataset.schema.names if c != "SEARCH_BLOB"]
+    return _to_frame(pq.read_table(dataset.files[0], columns=columns, memory_map=True))
+
+@st.cache_data
+def load_year_summary(path, mtime):
+    """Dashboard KPI scalars written by the pipeline; mtime keys the cache so rewrites refresh it."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+@st.cache_data
+def load_top_plans(path, mtime):
+    """Pipeline-precomputed top plans by retiree count; mtime keys the cache so rewrites refresh it."""
+    return pd.read_parquet(path)
@@ -0,0 +1,39 @@
+"""
+Shared file I/O helpers for pipeline outputs.
+
+Parquet outputs are read-mostly (the Streamlit app scans them on every
+cold cache), so they are written with zstd compression, large row groups
+and column statistics to make row-group pruning effective.
+"""
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 128_000,
+    "write_statistics": True,
+}
+
+
+def write_parquet(df: pd.DataFrame, path, sort_by=None, descending: bool = False):
+    """
+    Write a DataFrame to parquet using PARQUET_WRITE_OPTIONS.
+
+    Args:
+        df: DataFrame to write (the index is not stored)
+        path: Output file path
+        sort_by: Optional column name or list of column names; rows are sorted
+            by them before writing and the order is recorded in the parquet
+            sorting_columns metadata
+        descending: Sort direction for sort_by
+    """
+    options = dict(PARQUET_WRITE_OPTIONS)
+    if sort_by is not None:
+        sort_cols = [sort_by] if isinstance(sort_by, str) else list(sort_by)
+        df = df.sort_values(sort_cols, ascending=not descending, kind="stable", na_position="last")
+        options["sorting_columns"] = [
+            pq.SortingColumn(df.columns.get_loc(c), descending=descending) for c in sort_cols
+        ]
+    df.to_parquet(path, index=False, **options)
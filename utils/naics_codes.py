@@ -5,6 +5,9 @@ Provides mapping from NAICS codes to industry names and sectors.
 Used to enrich Form 5500 data with human-readable industry classifications.
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Tuple
 
 # NAICS 2-digit sector codes
@@ -255,6 +258,10 @@ NAICS_CODES = {
     "213000": "Support Activities for Mining",
 }
 
+# Freeze both tables (read-only views) and share one string object per repeated name
+NAICS_SECTORS = MappingProxyType({code: sys.intern(name) for code, name in NAICS_SECTORS.items()})
+NAICS_CODES = MappingProxyType({code: sys.intern(desc) for code, desc in NAICS_CODES.items()})
+
 
 def get_naics_description(code: Optional[str]) -> str:
     """
@@ -266,26 +273,30 @@ def get_naics_description(code: Optional[str]) -> str:
     Returns:
         Industry description or 'Unknown' if not found
     """
+    # Guard stays outside the cache: lru_cache hashes its argument before the body runs
     if not code or not isinstance(code, str):
         return "Unknown"
+    return _naics_description(code)
+
+
+@lru_cache(maxsize=4096)
+def _naics_description(code: str) -> str:
+    """Cached body of get_naics_description (code already known to be a non-empty str)."""
+    code = code.strip()
     
-    code = str(code).strip()
-    
-    # Try exact match first
-    if code in NAICS_CODES:
-        return NAICS_CODES[code]
+    # Try exact match first (single probe: table values are never None)
+    desc = NAICS_CODES.get(code)
+    if desc is not None:
+        return desc
     
-    # Try without leading zeros or with padding
-    code_clean = code.lstrip("0")
-    for naics, desc in NAICS_CODES.items():
-        if naics.lstrip("0") == code_clean:
-            return desc
+    # Try without leading zeros (NAICS_CODES keys are 6-digit and never start with "0")
+    desc = NAICS_CODES.get(code.lstrip("0"))
+    if desc is not None:
+        return desc
     
     # Fall back to sector-level description
     if len(code) >= 2:
-        sector = code[:2]
-        if sector in NAICS_SECTORS:
-            return NAICS_SECTORS[sector]
+        return NAICS_SECTORS.get(code[:2], "Unknown")
     
     return "Unknown"
 
@@ -302,8 +313,13 @@ def get_naics_sector(code: Optional[str]) -> str:
     """
     if not code or not isinstance(code, str):
         return "Unknown"
-    
-    code = str(code).strip()
+    return _naics_sector(code)
+
+
+@lru_cache(maxsize=4096)
+def _naics_sector(code: str) -> str:
+    """Cached body of get_naics_sector (code already known to be a non-empty str)."""
+    code = code.strip()
     if len(code) >= 2:
         sector = code[:2]
         return NAICS_SECTORS.get(sector, "Unknown")
@@ -313,7 +329,7 @@ def get_naics_sector(code: Optional[str]) -> str:
 
 def get_naics_info(code: Optional[str]) -> Tuple[str, str]:
     """
-    Get both sector and description for a NAICS code.
+    Get both sector and description for a NAICS code in one pass.
     
     Args:
         code: NAICS code
@@ -321,25 +337,116 @@ def get_naics_info(code: Optional[str]) -> Tuple[str, str]:
     Returns:
         Tuple of (sector_name, industry_description)
     """
-    return get_naics_sector(code), get_naics_description(code)
+    if not code or not isinstance(code, str):
+        return "Unknown", "Unknown"
+    return _naics_info(code)
+
+
+@lru_cache(maxsize=4096)
+def _naics_info(code: str) -> Tuple[str, str]:
+    """Cached body of get_naics_info (code already known to be a non-empty str)."""
+    code = code.strip()
+    sector = NAICS_SECTORS.get(code[:2], "Unknown") if len(code) >= 2 else "Unknown"
+    # Description falls back to the sector name, same as get_naics_description
+    desc = NAICS_CODES.get(code) or NAICS_CODES.get(code.lstrip("0")) or sector
+    return sector, desc
+
+
+# Sector name by 2-digit prefix 0-99, for integer-coded NAICS arrays
+_SECTOR_BY_PREFIX = [NAICS_SECTORS.get(f"{p:02d}", "Unknown") if p >= 10 else "Unknown" for p in range(100)]
+
+
+def _int_codes(codes):
+    """Integer codes as int64 (missing -> 0) plus a mask of the missing entries (NaN / pd.NA)."""
+    import numpy as np
+    import pandas as pd
+    
+    codes = pd.Series(codes) if not isinstance(codes, pd.Series) else codes
+    missing = codes.isna().to_numpy()
+    return codes.to_numpy(dtype=np.int64, na_value=0), missing
+
+
+def get_naics_sectors(codes):
+    """
+    Vectorized get_naics_sector for integer NAICS codes.
+    
+    Args:
+        codes: array-like of integer NAICS codes (any length)
+        
+    Returns:
+        numpy object array of sector names ('Unknown' for codes under 2 digits or missing)
+    """
+    import numpy as np
+    
+    codes, missing = _int_codes(codes)
+    # Leading two digits: shift right one decimal place at a time until every code is < 100
+    prefix = codes.copy()
+    while (prefix >= 100).any():
+        prefix = np.where(prefix >= 100, prefix // 10, prefix)
+    prefix = np.where((codes >= 10) & ~missing, prefix, 0)
+    return np.asarray(_SECTOR_BY_PREFIX, dtype=object)[prefix]
 
 
-def enrich_with_naics(df, code_column: str = "BUSINESS_CODE"):
+@lru_cache(maxsize=None)
+def _naics_int_table():
+    """NAICS_CODES as parallel arrays (int keys ascending, descriptions), built on first use."""
+    import numpy as np
+    
+    keys = sorted(NAICS_CODES, key=int)
+    return np.array([int(k) for k in keys], dtype=np.int64), np.array([NAICS_CODES[k] for k in keys], dtype=object)
+
+
+def get_naics_descriptions(codes):
+    """
+    Vectorized get_naics_description for integer NAICS codes.
+    
+    Args:
+        codes: array-like of integer NAICS codes
+        
+    Returns:
+        numpy object array of descriptions (sector name, then 'Unknown', as fallbacks)
+    """
+    import numpy as np
+    
+    int_codes, missing = _int_codes(codes)
+    keys, descs = _naics_int_table()
+    # Binary search over the sorted key array instead of a dict probe per code
+    pos = np.minimum(np.searchsorted(keys, int_codes), len(keys) - 1)
+    found = (keys[pos] == int_codes) & ~missing
+    return np.where(found, descs[pos], get_naics_sectors(codes))
+
+
+def enrich_with_naics(df, code_column: str = "BUSINESS_CODE", inplace: bool = False):
     """
     Add sector and industry columns to a DataFrame based on NAICS codes.
     
     Args:
         df: pandas DataFrame with NAICS codes
         code_column: Name of the column containing NAICS codes
+        inplace: Add the columns to df itself instead of returning a new frame
         
     Returns:
         DataFrame with added INDUSTRY_SECTOR and INDUSTRY_NAME columns
     """
     import pandas as pd
     
-    df = df.copy()
-    df["INDUSTRY_SECTOR"] = df[code_column].astype(str).apply(get_naics_sector)
-    df["INDUSTRY_NAME"] = df[code_column].astype(str).apply(get_naics_description)
+    codes = df[code_column]
+    if codes.dtype.kind in "iu":
+        # Integer-coded NAICS: prefix table for sectors, sorted-key search for descriptions; no int -> str boxing
+        sector = get_naics_sectors(codes)
+        name = get_naics_descriptions(codes)
+    else:
+        # Few distinct codes: look each up once, then map the rows through a dict
+        codes = codes.astype(str)
+        info = {c: get_naics_info(c) for c in codes.unique()}
+        sector = codes.map({c: s for c, (s, _) in info.items()})
+        name = codes.map({c: d for c, (_, d) in info.items()})
+    
+    if not inplace:
+        # Shallow copy: the new frame shares the existing column data, only the two new columns are added
+        df = df.copy(deep=False)
+    df["INDUSTRY_SECTOR"] = sector
+    df["INDUSTRY_NAME"] = name
     
     return df
 
@@ -354,3 +461,14 @@ if __name__ == "__main__":
         sector = get_naics_sector(code)
         desc = get_naics_description(code)
         print(f"{code}: {sector} | {desc}")
+    
+    # Integer-coded column with missing values: must match the string path ('<NA>' -> Unknown)
+    import pandas as pd
+    
+    int_df = pd.DataFrame({"BUSINESS_CODE": pd.array([622000, pd.NA, 541110, 11, 5], dtype="Int64")})
+    int_result = enrich_with_naics(int_df)
+    str_result = enrich_with_naics(int_df.astype(str))
+    assert int_result["INDUSTRY_SECTOR"].tolist() == str_result["INDUSTRY_SECTOR"].tolist()
+    assert int_result["INDUSTRY_NAME"].tolist() == str_result["INDUSTRY_NAME"].tolist()
+    assert int_result["INDUSTRY_NAME"].tolist()[1] == "Unknown"
+    print("\nInteger-coded (Int64 with NA) enrichment matches the string path.")
@@ -45,6 +45,33 @@ FIRM_NORMALIZATION_RULES = [
 _COMPILED_RULES = [(re.compile(pattern, re.IGNORECASE), canonical) 
                    for pattern, canonical in FIRM_NORMALIZATION_RULES]
 
+# All rules as one alternation (group gN = rule N), so a name matching no rule costs one scan
+_MEGA = re.compile(
+    "|".join(f"(?P<g{i}>{pattern})" for i, (pattern, _) in enumerate(FIRM_NORMALIZATION_RULES)),
+    re.IGNORECASE,
+)
+_CANON = [canonical for _, canonical in FIRM_NORMALIZATION_RULES]
+
+# Rules that are a single whole word (r'\bMERCER\b') become a word -> rule index dict, hit via tokens;
+# the rest stay regex, kept in rule order so they can still outrank a later literal hit
+_WORD = re.compile(r"\w+")
+_LITERAL_RULES = {}
+_COMPLEX_RULES = []
+for _i, (_pattern, _) in enumerate(FIRM_NORMALIZATION_RULES):
+    _m = re.fullmatch(r"\\b(\w+)\\b", _pattern)
+    if _m:
+        _LITERAL_RULES[_m.group(1).upper()] = _i
+    else:
+        _COMPLEX_RULES.append((_i, _COMPILED_RULES[_i][0]))
+_LITERAL_WORDS = frozenset(_LITERAL_RULES)
+
+
+def _clean_firm_name(firm_name):
+    """Whitespace-strip a name; non-strings pass through and blank names become None."""
+    if firm_name is None or not isinstance(firm_name, str):
+        return firm_name
+    return firm_name.strip() or None
+
 
 def normalize_firm_name(firm_name: Optional[str]) -> Optional[str]:
     """
@@ -56,18 +83,30 @@ def normalize_firm_name(firm_name: Optional[str]) -> Optional[str]:
     Returns:
         Canonical firm name if a match is found, otherwise the original name (cleaned)
     """
-    if firm_name is None or not isinstance(firm_name, str):
-        return firm_name
-    
     # Basic cleaning
-    cleaned = firm_name.strip()
-    if not cleaned:
-        return None
+    cleaned = _clean_firm_name(firm_name)
+    if not isinstance(cleaned, str):
+        return cleaned
     
-    # Try each normalization rule
-    for pattern, canonical in _COMPILED_RULES:
-        if pattern.search(cleaned):
-            return canonical
+    # Literal words: set lookup on tokens, then only earlier irregular rules can take priority
+    literal_hits = _LITERAL_WORDS.intersection(_WORD.findall(cleaned.upper()))
+    if literal_hits:
+        hit = min(_LITERAL_RULES[word] for word in literal_hits)
+        for i, pattern in _COMPLEX_RULES:
+            if i >= hit:
+                break
+            if pattern.search(cleaned):
+                return _CANON[i]
+        return _CANON[hit]
+    
+    # One combined scan; on a hit, only rules listed before the leftmost match can take priority
+    m = _MEGA.search(cleaned)
+    if m:
+        hit = int(m.lastgroup[1:])
+        for pattern, canonical in _COMPILED_RULES[:hit]:
+            if pattern.search(cleaned):
+                return canonical
+        return _CANON[hit]
     
     # No match - return cleaned original (title case for consistency)
     # But preserve original if it looks intentional (all caps firm names are common)
@@ -84,7 +123,18 @@ def normalize_firm_names_series(series):
     Returns:
         pandas Series with normalized firm names
     """
-    return series.apply(normalize_firm_name)
+    import pandas as pd
+    
+    # Firm names repeat heavily: work on distinct names only, then map the rows
+    names = pd.Series(series.dropna().unique(), dtype=object)
+    # One bulk str.extract pass of the shared alternation over the stripped names (so ^EY / ^PWC still anchor);
+    # names matching no rule only need cleaning, the rest go through the priority-aware scalar path
+    has_rule = names.str.strip().str.extract(_MEGA).notna().any(axis=1).to_numpy()
+    mapping = {
+        name: normalize_firm_name(name) if hit else _clean_firm_name(name)
+        for name, hit in zip(names, has_rule)
+    }
+    return series.map(mapping)
 
 
 def get_canonical_firm_list():
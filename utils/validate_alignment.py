@@ -14,6 +14,21 @@ to the same DOL release batch.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from types import MappingProxyType
+
+# Diagnosis messages, shared by reference across reports
+_DIAG_NONE = (
+    "No ACK_IDs overlap. This usually means the SB and 5500 datasets "
+    "are from different DOL release batches OR the 5500 dataset does not yet "
+    "include the full header set for DB plans."
+)
+_DIAG_LOW = (
+    "Very low alignment (<10%). Most SB filings lack matching 5500 headers. "
+    "This may indicate partial or early-cycle 5500 data."
+)
+_DIAG_OK = "Datasets appear reasonably aligned."
 
 def extract_ack_date(ack_id: str):
     """Extract YYYYMMDD from ACK_ID (first 8 characters)."""
@@ -22,6 +37,29 @@ def extract_ack_date(ack_id: str):
     return None
 
 
+def unique_ack_ids(ack_ids: pd.Series) -> pa.Array:
+    """Distinct non-null ACK_IDs as an Arrow string array, without an astype(str) copy when already strings."""
+    ack_ids = ack_ids.dropna()
+    try:
+        arr = pa.array(ack_ids)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arr = None
+    if arr is None or not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        # Numeric or mixed-type column: stringify in pandas so IDs keep their str() form
+        arr = pa.array(ack_ids.astype(str), type=pa.string())
+    return pc.unique(arr)
+
+
+def ack_date_range(ack_ids: pa.Array):
+    """(earliest, latest) YYYYMMDD prefix over ACK_IDs of 8+ characters, or ("N/A", "N/A")."""
+    ack_ids = ack_ids.filter(pc.greater_equal(pc.utf8_length(ack_ids), 8))
+    if len(ack_ids) == 0:
+        return ("N/A", "N/A")
+    # Date prefix as one Arrow kernel over the string buffer, then a single min/max pass
+    dates = pc.min_max(pc.utf8_slice_codeunits(ack_ids, 0, 8))
+    return (dates["min"].as_py(), dates["max"].as_py())
+
+
 def validate_alignment(sb_df: pd.DataFrame, f5500_df: pd.DataFrame):
     report = {}
 
@@ -29,42 +67,35 @@ def validate_alignment(sb_df: pd.DataFrame, f5500_df: pd.DataFrame):
     report["sb_rows"] = len(sb_df)
     report["f5500_rows"] = len(f5500_df)
 
-    # Count distinct ACK IDs
-    report["sb_ack_unique"] = sb_df["ack_id"].nunique()
-    report["f5500_ack_unique"] = f5500_df["ack_id"].nunique()
+    # Distinct ACK IDs as Arrow arrays: one hash pass per dataset, reused for counts and matching
+    sb_acks = unique_ack_ids(sb_df["ack_id"])
+    f5500_acks = unique_ack_ids(f5500_df["ack_id"])
 
-    # Identify matches
-    sb_ack_set = set(sb_df["ack_id"].astype(str))
-    f5500_ack_set = set(f5500_df["ack_id"].astype(str))
+    report["sb_ack_unique"] = len(sb_acks)
+    report["f5500_ack_unique"] = len(f5500_acks)
 
-    matching_ack = sb_ack_set.intersection(f5500_ack_set)
+    # Identify matches (vectorized hash-set membership, no Python str set). Both sides are unique,
+    # so the count is symmetric: hash the smaller array and stream the larger one past it
+    smaller, larger = sorted((sb_acks, f5500_acks), key=len)
+    ack_matches = pc.sum(pc.is_in(larger, value_set=smaller)).as_py() or 0
 
-    report["ack_matches"] = len(matching_ack)
+    report["ack_matches"] = ack_matches
     report["ack_match_pct"] = (
-        len(matching_ack) / len(sb_ack_set) * 100
-        if len(sb_ack_set) > 0 else 0
+        ack_matches / len(sb_acks) * 100
+        if len(sb_acks) > 0 else 0
     )
 
     # Extract and compare filing date ranges
-    sb_dates = sorted({extract_ack_date(a) for a in sb_ack_set if extract_ack_date(a)})
-    f5500_dates = sorted({extract_ack_date(a) for a in f5500_ack_set if extract_ack_date(a)})
-
-    report["sb_date_range"] = (sb_dates[0], sb_dates[-1]) if sb_dates else ("N/A", "N/A")
-    report["f5500_date_range"] = (f5500_dates[0], f5500_dates[-1]) if f5500_dates else ("N/A", "N/A")
+    report["sb_date_range"] = ack_date_range(sb_acks)
+    report["f5500_date_range"] = ack_date_range(f5500_acks)
 
     # Diagnostic interpretation
     if report["ack_matches"] == 0:
-        report["diagnosis"] = (
-            "No ACK_IDs overlap. This usually means the SB and 5500 datasets "
-            "are from different DOL release batches OR the 5500 dataset does not yet "
-            "include the full header set for DB plans."
-        )
+        report["diagnosis"] = _DIAG_NONE
     elif report["ack_match_pct"] < 10:
-        report["diagnosis"] = (
-            "Very low alignment (<10%). Most SB filings lack matching 5500 headers. "
-            "This may indicate partial or early-cycle 5500 data."
-        )
+        report["diagnosis"] = _DIAG_LOW
     else:
-        report["diagnosis"] = "Datasets appear reasonably aligned."
+        report["diagnosis"] = _DIAG_OK
 
-    return report
+    # Read-only view: the report is a result, not a scratch dict
+    return MappingProxyType(report)